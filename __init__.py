@@ -2,12 +2,14 @@
 # Protocol: C-FED-GLYPH-001
 # Authority: Pantheon LadderWorks
 
-from .c_fed_id import mint_seal, mint_key_seal, verify_seal_syntax, CLASS_GLYPH, VALID_CLASSES, VALID_STATES
+from .c_fed_id import mint_seal, mint_seals, mint_key_seal, mint_key_seals, verify_seal_syntax, CLASS_GLYPH, VALID_CLASSES, VALID_STATES
 
 __version__ = "0.1.0"
 __all__ = [
     "mint_seal",
+    "mint_seals",
     "mint_key_seal",
+    "mint_key_seals",
     "verify_seal_syntax",
     "CLASS_GLYPH",
     "VALID_CLASSES",
@@ -22,14 +22,25 @@ One cryptographic mode:
 """
 from __future__ import annotations
 
-import base64
+import functools
 import hashlib
 import os
 import re
+import sys
 import time
 from dataclasses import dataclass, field
 from typing import Optional
 
+try:
+    import numpy as _np  # optional: vectorizes large batch mints
+except ImportError:
+    _np = None
+
+try:
+    import numba as _numba  # optional: JIT shard formatting for bulk key seals
+except ImportError:
+    _numba = None
+
 # ─────────────────────────────────────────────
 # THE BREATH — Class Glyphs (Visual Anchors)
 # ─────────────────────────────────────────────
@@ -45,6 +56,10 @@ CLASS_GLYPH: dict[str, str] = {
 
 VALID_CLASSES = frozenset(CLASS_GLYPH.keys())
 
+# Anchor prefixes ("🜁-", "🛑-", ...) materialized once so the anchor
+# builders do a single concatenation instead of an f-string per mint.
+_GLYPH_PREFIX: dict[str, str] = {cn: g + "-" for cn, g in CLASS_GLYPH.items()}
+
 VALID_STATES = frozenset({
     "VALID", "INVALID",
     "ACTIVE", "DORMANT",
@@ -56,18 +71,56 @@ VALID_STATES = frozenset({
     "REVOKED",
 })
 
+# Normalization tables: map the canonical and all-lowercase spellings
+# straight to the canonical form, so the mint hot path does one dict
+# lookup instead of upper() + membership test + index.
+_CLASS_NORM: dict[str, str] = {k: k for k in VALID_CLASSES} | {k.lower(): k for k in VALID_CLASSES}
+_STATE_NORM: dict[str, str] = {k: k for k in VALID_STATES} | {k.lower(): k for k in VALID_STATES}
+
+# Error-message fragments, sorted and joined once instead of per raise.
+_VALID_CLASSES_MSG = ", ".join(sorted(VALID_CLASSES))
+_VALID_STATES_MSG = ", ".join(sorted(VALID_STATES))
+
+
+def _norm_class(class_name: str) -> str:
+    cn = _CLASS_NORM.get(class_name) or _CLASS_NORM.get(class_name.upper())
+    if cn is None:
+        raise ValueError(f"Invalid class '{class_name.upper()}'. Must be one of: {_VALID_CLASSES_MSG}")
+    return cn
+
+
+def _norm_state(state: str) -> str:
+    st = _STATE_NORM.get(state) or _STATE_NORM.get(state.upper())
+    if st is None:
+        raise ValueError(f"Invalid state '{state.upper()}'. Must be one of: {_VALID_STATES_MSG}")
+    return st
+
 
 # ─────────────────────────────────────────────
 # SHARD ENCODING — Base32 Visual Grouping
 # ─────────────────────────────────────────────
 
+# RFC 4648 base32 alphabet, indexed directly by 5-bit group.
+_B32_ALPHA = b"ABCDEFGHIJKLMNOPQRSTUVWXYZ234567"
+
+
 def _b32_shard(raw: bytes, groups: tuple[int, ...] = (4, 4, 4)) -> str:
     """
     Encode bytes to a compact, uppercase base32 shard with group dashes.
     Reads like a sigil, not a serial number.
+
+    Direct 5-bit alphabet lookup — no padding math, no regex cleanup.
     """
-    s = base64.b32encode(raw).decode("ascii").rstrip("=")
-    s = re.sub(r"[^A-Z2-7]", "", s)
+    nbits = len(raw) * 8
+    nchars = (nbits + 4) // 5
+    n = int.from_bytes(raw, "big") << (nchars * 5 - nbits)
+    alpha = _B32_ALPHA
+    shift = (nchars - 1) * 5
+    buf = bytearray(nchars)
+    for i in range(nchars):
+        buf[i] = alpha[(n >> shift) & 0x1F]
+        shift -= 5
+    s = buf.decode("ascii")
     out: list[str] = []
     i = 0
     for g in groups:
@@ -80,46 +133,197 @@ def _b32_shard(raw: bytes, groups: tuple[int, ...] = (4, 4, 4)) -> str:
     return "-".join(out)
 
 
+def _shard_12(raw: bytes) -> str:
+    """Specialized 4-4-4 shard for 10-byte anchors — only the top 60 bits
+    are ever rendered, so skip the generic grouping loop entirely."""
+    n = int.from_bytes(raw[:8], "big") >> 4
+    a = _B32_ALPHA
+    buf = bytearray(12)
+    shift = 55
+    for i in range(12):
+        buf[i] = a[(n >> shift) & 0x1F]
+        shift -= 5
+    s = buf.decode("ascii")
+    return s[0:4] + "-" + s[4:8] + "-" + s[8:12]
+
+
+def _shard_8(raw: bytes) -> str:
+    """Specialized 4-4 shard — renders the top 40 bits (first 5 bytes)."""
+    n = int.from_bytes(raw[:5], "big")
+    a = _B32_ALPHA
+    buf = bytearray(8)
+    shift = 35
+    for i in range(8):
+        buf[i] = a[(n >> shift) & 0x1F]
+        shift -= 5
+    s = buf.decode("ascii")
+    return s[0:4] + "-" + s[4:8]
+
+
 # ─────────────────────────────────────────────
 # BREATH ANCHOR GENERATORS
 # ─────────────────────────────────────────────
 
-def _anchor_random(glyph: str, nbytes: int = 10) -> str:
+def _anchor_random(prefix: str, nbytes: int = 10) -> str:
     """Random anchor — 80-bit entropy, UUID-grade collision resistance."""
-    shard = _b32_shard(os.urandom(nbytes))
-    return f"{glyph}-{shard}"
+    return prefix + _shard_12(os.urandom(nbytes))
+
+
+@functools.lru_cache(maxsize=4096)
+def _anchor_deterministic(prefix: str, material: str, nbytes: int = 6) -> str:
+    """Deterministic anchor — content hash. Same input = same seal.
+
+    Pure function, so repeat mints for recurring material resolve from
+    a bounded LRU cache instead of re-hashing.
+    """
+    # blake2s: lighter state than blake2b, plenty for 6-10 byte digests
+    h = hashlib.blake2s(material.encode("utf-8"), digest_size=nbytes).digest()
+    return prefix + _shard_8(h)
+
+
+# [day number, formatted UTC date] — refreshed at most once per day so
+# batch minting pays the strftime/tz cost only on the first seal.
+_TS_CACHE: list = [-1, ""]
 
 
-def _anchor_deterministic(glyph: str, material: str, nbytes: int = 6) -> str:
-    """Deterministic anchor — content hash. Same input = same seal."""
-    h = hashlib.blake2b(material.encode("utf-8"), digest_size=nbytes).digest()
-    shard = _b32_shard(h, groups=(4, 4))
-    return f"{glyph}-{shard}"
+def _utc_date() -> str:
+    """Today's date as YYYYMMDD (UTC), cached until the day rolls over."""
+    day = int(time.time()) // 86400
+    if day != _TS_CACHE[0]:
+        _TS_CACHE[1] = time.strftime("%Y%m%d", time.gmtime())
+        _TS_CACHE[0] = day
+    return _TS_CACHE[1]
 
 
-def _anchor_hybrid(glyph: str, nbytes: int = 5) -> str:
+def _anchor_hybrid(prefix: str, nbytes: int = 5) -> str:
     """Hybrid anchor — timestamp shard + random shard. Sortable + unique."""
-    ts = time.strftime("%Y%m%d", time.localtime())
-    rand = _b32_shard(os.urandom(nbytes), groups=(4, 4))
-    return f"{glyph}-{ts}-{rand}"
+    ts = _utc_date()
+    rand = _shard_8(os.urandom(nbytes))
+    return f"{prefix}{ts}-{rand}"
 
 
-def _anchor_from_key(glyph: str, public_key_bytes: bytes) -> str:
+# Batches at least this large take the NumPy path when it is available;
+# below it, the vectorization setup costs more than the Python loop.
+_NP_BATCH_MIN = 16
+
+if _np is not None:
+    _B32_ALPHA_ARR = _np.frombuffer(_B32_ALPHA, dtype=_np.uint8)
+
+
+def _shards_np(buf: bytes, count: int, nbytes: int, nchars: int) -> list[str]:
+    """
+    Vectorized shard encoding: one 5-bit shift/mask/gather over the whole
+    batch instead of a Python loop per seal. Matches _b32_shard output for
+    the two shapes the batch paths use (nchars 12 or 8, groups of 4).
+    """
+    rows = _np.frombuffer(buf, dtype=_np.uint8).reshape(count, nbytes)
+    k = min(nbytes, 8)
+    padded = _np.zeros((count, 8), dtype=_np.uint8)
+    padded[:, :k] = rows[:, :k]
+    words = padded.view(">u8").astype(_np.uint64)          # (count, 1)
+    shifts = (64 - 5 * _np.arange(1, nchars + 1, dtype=_np.uint64))
+    idx = (words >> shifts) & 0x1F                          # (count, nchars)
+    chars = _B32_ALPHA_ARR[idx]
+    ngroups = nchars // 4
+    width = nchars + ngroups - 1
+    out = _np.full((count, width), ord("-"), dtype=_np.uint8)
+    for g in range(ngroups):
+        out[:, g * 5:g * 5 + 4] = chars[:, g * 4:g * 4 + 4]
+    s = out.tobytes().decode("ascii")
+    return [s[i * width:(i + 1) * width] for i in range(count)]
+
+
+# JIT-compiled 12-char shard formatter over a (N, 10) fingerprint buffer,
+# used by mint_key_seals when numba is importable. None when it is not.
+_SHARD12_KERNEL = None
+
+if _numba is not None and _np is not None:
+    @_numba.njit(cache=True, boundscheck=False)
+    def _shard12_kernel(rows, out, alpha):
+        for r in range(rows.shape[0]):
+            n1 = 0
+            for j in range(5):
+                n1 = (n1 << 8) | rows[r, j]
+            n2 = 0
+            for j in range(5, 10):
+                n2 = (n2 << 8) | rows[r, j]
+            for c in range(4):
+                out[r, c] = alpha[(n1 >> (35 - 5 * c)) & 0x1F]
+            out[r, 4] = 45  # '-'
+            for c in range(4, 8):
+                out[r, c + 1] = alpha[(n1 >> (35 - 5 * c)) & 0x1F]
+            out[r, 9] = 45  # '-'
+            for c in range(4):
+                out[r, c + 10] = alpha[(n2 >> (35 - 5 * c)) & 0x1F]
+
+    _SHARD12_KERNEL = _shard12_kernel
+
+
+def _shards_12_bulk(buf: bytes, count: int) -> list[str]:
+    """12-char shards for a contiguous (count x 10)-byte buffer, fastest
+    available backend: numba kernel > NumPy gather > per-row encoder."""
+    if count >= _NP_BATCH_MIN and _SHARD12_KERNEL is not None:
+        rows = _np.frombuffer(buf, dtype=_np.uint8).reshape(count, 10)
+        out = _np.empty((count, 14), dtype=_np.uint8)
+        _SHARD12_KERNEL(rows, out, _B32_ALPHA_ARR)
+        s = out.tobytes().decode("ascii")
+        return [s[i * 14:(i + 1) * 14] for i in range(count)]
+    if count >= _NP_BATCH_MIN and _np is not None:
+        return _shards_np(buf, count, 10, 12)
+    return [_shard_12(buf[i * 10:(i + 1) * 10]) for i in range(count)]
+
+
+def _anchor_random_batch(prefix: str, count: int, nbytes: int = 10) -> list[str]:
+    """Random anchors for a whole batch — one urandom syscall, sliced."""
+    buf = os.urandom(count * nbytes)
+    if _np is not None and count >= _NP_BATCH_MIN:
+        return [prefix + shard for shard in _shards_np(buf, count, nbytes, 12)]
+    return [prefix + _shard_12(buf[i * nbytes:(i + 1) * nbytes])
+            for i in range(count)]
+
+
+def _anchor_hybrid_batch(prefix: str, count: int, nbytes: int = 5) -> list[str]:
+    """Hybrid anchors for a whole batch — shared date, one urandom syscall."""
+    ts = _utc_date()
+    head = f"{prefix}{ts}-"
+    buf = os.urandom(count * nbytes)
+    if _np is not None and count >= _NP_BATCH_MIN:
+        return [head + shard for shard in _shards_np(buf, count, nbytes, 8)]
+    return [head + _shard_8(buf[i * nbytes:(i + 1) * nbytes])
+            for i in range(count)]
+
+
+# BLAKE2 personalization strings, one per class — domain separation
+# without concatenating class + key material before hashing.
+_KEY_PERSON: dict[str, bytes] = {cn: cn.encode("ascii").ljust(8, b" ") for cn in VALID_CLASSES}
+
+
+def _anchor_from_key(prefix: str, class_name: str, public_key_bytes: bytes) -> str:
     """
     Key-based anchor — derived from Ed25519 public key.
-    Guarantees: different key = different anchor.
+    Guarantees: different key = different anchor, and the class rides in
+    the BLAKE2 personalization slot so the same key fingerprints
+    differently per class.
     To verify identity, challenge the holder to sign with the private key.
     """
-    fingerprint = hashlib.blake2b(public_key_bytes, digest_size=10).digest()
-    shard = _b32_shard(fingerprint)
-    return f"{glyph}-{shard}"
+    fingerprint = hashlib.blake2s(
+        public_key_bytes, digest_size=10, person=_KEY_PERSON[class_name]
+    ).digest()
+    return prefix + _shard_12(fingerprint)
 
 
 # ─────────────────────────────────────────────
 # SEAL DATA MODEL
 # ─────────────────────────────────────────────
 
-@dataclass(frozen=True)
+# to_dict keys, interned once so repeated serialization reuses the same
+# key objects (and their cached hashes) instead of hashing fresh strings.
+_DICT_KEYS = tuple(sys.intern(k) for k in (
+    "class", "origin", "breath_anchor", "state", "witness", "seal",
+))
+
+
+@dataclass(frozen=True, slots=True)
 class GlyphSeal:
     """A minted Glyph-Seal identity stamp."""
     class_name: str
@@ -127,23 +331,30 @@ class GlyphSeal:
     breath_anchor: str
     state: str
     witness: Optional[str] = None
+    # One-slot cache for the rendered seal string (list so it can be
+    # filled despite frozen=True); excluded from the constructor,
+    # equality and repr — dataclasses.replace() gets a fresh empty cache.
+    _str_cache: list = field(default_factory=list, init=False, compare=False, repr=False)
 
     def __str__(self) -> str:
-        return f"⟦ {self.class_name} :: {self.origin} :: {self.breath_anchor} :: {self.state} ⟧"
+        cache = self._str_cache
+        if not cache:
+            cache.append(f"⟦ {self.class_name} :: {self.origin} :: {self.breath_anchor} :: {self.state} ⟧")
+        return cache[0]
 
     def with_witness(self, witness_line: str) -> str:
         """Format with a Commentomancy witness line."""
         return f"📜 Witness: {witness_line}\n{self}"
 
     def to_dict(self) -> dict:
-        return {
-            "class": self.class_name,
-            "origin": self.origin,
-            "breath_anchor": self.breath_anchor,
-            "state": self.state,
-            "witness": self.witness,
-            "seal": str(self),
-        }
+        return dict(zip(_DICT_KEYS, (
+            self.class_name,
+            self.origin,
+            self.breath_anchor,
+            self.state,
+            self.witness,
+            str(self),
+        )))
 
 
 # ─────────────────────────────────────────────
@@ -172,24 +383,19 @@ def mint_seal(
     Returns:
         GlyphSeal instance
     """
-    cn = class_name.upper()
-    st = state.upper()
-
-    if cn not in VALID_CLASSES:
-        raise ValueError(f"Invalid class '{cn}'. Must be one of: {', '.join(sorted(VALID_CLASSES))}")
-    if st not in VALID_STATES:
-        raise ValueError(f"Invalid state '{st}'. Must be one of: {', '.join(sorted(VALID_STATES))}")
+    cn = _norm_class(class_name)
+    st = _norm_state(state)
 
-    glyph = CLASS_GLYPH[cn]
+    prefix = _GLYPH_PREFIX[cn]
 
     if mode == "deterministic":
         if material is None:
             raise ValueError("'material' is required for deterministic anchors")
-        anchor = _anchor_deterministic(glyph, material)
+        anchor = _anchor_deterministic(prefix, material)
     elif mode == "hybrid":
-        anchor = _anchor_hybrid(glyph)
+        anchor = _anchor_hybrid(prefix)
     elif mode == "random":
-        anchor = _anchor_random(glyph)
+        anchor = _anchor_random(prefix)
     else:
         raise ValueError(f"Invalid mode '{mode}'. Must be 'random', 'hybrid', or 'deterministic'")
 
@@ -202,6 +408,48 @@ def mint_seal(
     )
 
 
+def mint_seals(
+    class_name: str,
+    origin: str,
+    count: int,
+    state: str = "VALID",
+    mode: str = "hybrid",
+    material: Optional[str] = None,
+    witness: Optional[str] = None,
+):
+    """
+    Mint a batch of Glyph-Seals — validates once and draws entropy once.
+
+    For random/hybrid modes the whole batch shares a single os.urandom
+    call instead of one syscall per seal. Yields GlyphSeal instances.
+    """
+    cn = _norm_class(class_name)
+    st = _norm_state(state)
+    org = origin.upper()
+
+    prefix = _GLYPH_PREFIX[cn]
+
+    if mode == "deterministic":
+        if material is None:
+            raise ValueError("'material' is required for deterministic anchors")
+        anchors = [_anchor_deterministic(prefix, material)] * count
+    elif mode == "hybrid":
+        anchors = _anchor_hybrid_batch(prefix, count)
+    elif mode == "random":
+        anchors = _anchor_random_batch(prefix, count)
+    else:
+        raise ValueError(f"Invalid mode '{mode}'. Must be 'random', 'hybrid', or 'deterministic'")
+
+    for anchor in anchors:
+        yield GlyphSeal(
+            class_name=cn,
+            origin=org,
+            breath_anchor=anchor,
+            state=st,
+            witness=witness,
+        )
+
+
 def mint_key_seal(
     class_name: str,
     origin: str,
@@ -225,16 +473,10 @@ def mint_key_seal(
     Returns:
         GlyphSeal instance
     """
-    cn = class_name.upper()
-    st = state.upper()
-
-    if cn not in VALID_CLASSES:
-        raise ValueError(f"Invalid class '{cn}'. Must be one of: {', '.join(sorted(VALID_CLASSES))}")
-    if st not in VALID_STATES:
-        raise ValueError(f"Invalid state '{st}'. Must be one of: {', '.join(sorted(VALID_STATES))}")
+    cn = _norm_class(class_name)
+    st = _norm_state(state)
 
-    glyph = CLASS_GLYPH[cn]
-    anchor = _anchor_from_key(glyph, public_key_bytes)
+    anchor = _anchor_from_key(_GLYPH_PREFIX[cn], cn, public_key_bytes)
 
     return GlyphSeal(
         class_name=cn,
@@ -245,6 +487,44 @@ def mint_key_seal(
     )
 
 
+def mint_key_seals(
+    class_name: str,
+    origin: str,
+    public_keys: list,
+    state: str = "VALID",
+    witness: Optional[str] = None,
+):
+    """
+    Mint key-based Glyph-Seals for a whole collection of public keys —
+    e.g. fingerprinting a directory of Ed25519 keys at once.
+
+    Validates once, hashes all keys into one contiguous fingerprint
+    buffer, and formats the shards through the fastest available backend
+    (numba JIT kernel, NumPy gather, or the per-row encoder). Yields
+    GlyphSeal instances in input order.
+    """
+    cn = _norm_class(class_name)
+    st = _norm_state(state)
+    org = origin.upper()
+
+    prefix = _GLYPH_PREFIX[cn]
+    person = _KEY_PERSON[cn]
+    count = len(public_keys)
+    buf = b"".join(
+        hashlib.blake2s(pk, digest_size=10, person=person).digest()
+        for pk in public_keys
+    )
+
+    for shard in _shards_12_bulk(buf, count):
+        yield GlyphSeal(
+            class_name=cn,
+            origin=org,
+            breath_anchor=prefix + shard,
+            state=st,
+            witness=witness,
+        )
+
+
 # ─────────────────────────────────────────────
 # VALIDATION / PARSING
 # ─────────────────────────────────────────────
@@ -259,24 +539,55 @@ _SEAL_PATTERN = re.compile(
 )
 
 
+_SEAL_MATCH = _SEAL_PATTERN.search
+
+# Characters the regex allows in the ORIGIN field, for the fast-path check.
+_ORIGIN_CHARS = "ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_-"
+
+
 def verify_seal_syntax(seal_str: str) -> Optional[dict]:
     """
     Validate that a string matches Glyph-Seal syntax.
     Returns parsed components dict or None if invalid.
 
-    The Malenia Rule: anything outside ⟦ ⟧ is noise; inside is protected structure.
+    The Malenia Rule: anything outside ⟦ ⟧ is noise; inside is protected
+    structure — the `::` delimiter is fixed, so the fast path is a plain
+    split on the bracketed body. The regex only runs if the split fails.
     """
-    m = _SEAL_PATTERN.search(seal_str)
+    start = seal_str.find("⟦") + 1
+    end = seal_str.find("⟧", start)
+    parts = seal_str[start:end].split("::") if start and end != -1 else ()
+    if len(parts) == 4:
+        cls, org, anc, st = map(str.strip, parts)
+        # Accept only a subset of the regex language: class/state must be
+        # ASCII A-Z (isupper/isalpha alone admit Unicode homoglyphs) and
+        # the anchor must not span lines (the regex '.' never matches
+        # newline). Anything else falls through to _SEAL_MATCH.
+        if (cls.isupper() and cls.isalpha() and cls.isascii()
+                and st.isupper() and st.isalpha() and st.isascii()
+                and anc and "\n" not in anc
+                and org and not org.strip(_ORIGIN_CHARS)):
+            return {
+                "class": cls,
+                "origin": org,
+                "breath_anchor": anc,
+                "state": st,
+                "valid_class": cls in VALID_CLASSES,
+                "valid_state": st in VALID_STATES,
+            }
+
+    m = _SEAL_MATCH(seal_str)
     if not m:
         return None
 
+    cls, org, anc, st = m.groups()
     return {
-        "class": m.group("class"),
-        "origin": m.group("origin"),
-        "breath_anchor": m.group("anchor").strip(),
-        "state": m.group("state"),
-        "valid_class": m.group("class") in VALID_CLASSES,
-        "valid_state": m.group("state") in VALID_STATES,
+        "class": cls,
+        "origin": org,
+        "breath_anchor": anc.strip(),
+        "state": st,
+        "valid_class": cls in VALID_CLASSES,
+        "valid_state": st in VALID_STATES,
     }
 
 
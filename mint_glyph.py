@@ -21,20 +21,31 @@ from __future__ import annotations
 import argparse
 import json
 import sys
-import os
 
-# Allow running from the glyph-forge directory or from anywhere
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-
-from c_fed_id import (
-    mint_seal,
-    verify_seal_syntax,
-    parse_seal,
-    CLASS_GLYPH,
-    VALID_CLASSES,
-    VALID_STATES,
-    GlyphSeal,
-)
+# Package import when installed, plain import when run as a script
+# (the interpreter already puts the script's directory on sys.path)
+try:
+    from .c_fed_id import (
+        mint_seal,
+        mint_seals,
+        verify_seal_syntax,
+        parse_seal,
+        CLASS_GLYPH,
+        VALID_CLASSES,
+        VALID_STATES,
+        GlyphSeal,
+    )
+except ImportError:
+    from c_fed_id import (
+        mint_seal,
+        mint_seals,
+        verify_seal_syntax,
+        parse_seal,
+        CLASS_GLYPH,
+        VALID_CLASSES,
+        VALID_STATES,
+        GlyphSeal,
+    )
 
 
 def print_seal(seal: GlyphSeal, verbose: bool = False) -> None:
@@ -54,18 +65,34 @@ def print_seal(seal: GlyphSeal, verbose: bool = False) -> None:
 def cmd_mint(args: argparse.Namespace) -> None:
     """Mint one or more Glyph-Seals."""
     count = getattr(args, "batch", 1) or 1
-    for i in range(count):
+    # Hoist argparse attribute lookups out of the loop — locals are
+    # cheaper than __getattr__ per seal and this compounds with --batch
+    cn, org, st, mode = args.class_name, args.origin, args.state, args.mode
+    mat, wit, verbose = args.material, args.witness, args.verbose
+    if count > 1:
+        # Batch path: one entropy draw for the whole run
+        for i, seal in enumerate(mint_seals(
+            class_name=cn,
+            origin=org,
+            count=count,
+            state=st,
+            mode=mode,
+            material=mat,
+            witness=wit,
+        )):
+            print_seal(seal, verbose=verbose)
+            if i < count - 1:
+                print()
+    else:
         seal = mint_seal(
-            class_name=args.class_name,
-            origin=args.origin,
-            state=args.state,
-            mode=args.mode,
-            material=args.material,
-            witness=args.witness,
+            class_name=cn,
+            origin=org,
+            state=st,
+            mode=mode,
+            material=mat,
+            witness=wit,
         )
-        print_seal(seal, verbose=args.verbose)
-        if count > 1 and i < count - 1:
-            print()
+        print_seal(seal, verbose=verbose)
 
 
 def cmd_parse(args: argparse.Namespace) -> None:
@@ -106,16 +133,36 @@ def cmd_states(args: argparse.Namespace) -> None:
 
 
 def cmd_json(args: argparse.Namespace) -> None:
-    """Mint a seal and output as JSON."""
-    seal = mint_seal(
-        class_name=args.class_name,
-        origin=args.origin,
-        state=args.state,
-        mode=args.mode,
-        material=args.material,
-        witness=args.witness,
-    )
-    print(json.dumps(seal.to_dict(), indent=2, ensure_ascii=False))
+    """Mint seal(s) and stream JSON to stdout."""
+    count = getattr(args, "batch", 1) or 1
+    out = sys.stdout
+    if count > 1:
+        # Incrementally written JSON array — no full-batch buffer
+        out.write("[\n")
+        for i, seal in enumerate(mint_seals(
+            class_name=args.class_name,
+            origin=args.origin,
+            count=count,
+            state=args.state,
+            mode=args.mode,
+            material=args.material,
+            witness=args.witness,
+        )):
+            if i:
+                out.write(",\n")
+            json.dump(seal.to_dict(), out, indent=2, ensure_ascii=False)
+        out.write("\n]\n")
+    else:
+        seal = mint_seal(
+            class_name=args.class_name,
+            origin=args.origin,
+            state=args.state,
+            mode=args.mode,
+            material=args.material,
+            witness=args.witness,
+        )
+        json.dump(seal.to_dict(), out, indent=2, ensure_ascii=False)
+        out.write("\n")
 
 
 def main() -> None:
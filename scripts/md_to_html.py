@@ -5,6 +5,7 @@ Open in browser, Ctrl+P, Save as PDF. Full Unicode support.
 """
 
 import markdown
+import re
 from pathlib import Path
 import sys
 import webbrowser
@@ -161,24 +162,30 @@ th {
 }
 """
 
+# One converter for the whole run — building a Markdown instance loads
+# extensions and compiles their regexes, so do it once, not per document.
+_MD = markdown.Markdown(extensions=['fenced_code', 'tables', 'nl2br'])
+
+# Math patterns, compiled once at import
+_DISPLAY_MATH_RE = re.compile(r'\$\$(.*?)\$\$', re.DOTALL)
+_INLINE_MATH_RE = re.compile(r'\$([^$]+)\$')
+
 def process_math(text):
     """Simple processing for LaTeX-style math to make it render nicely."""
-    import re
-    
     # Replace $$...$$ with styled divs (display math)
     def replace_display_math(match):
         content = match.group(1).strip()
         return f'<div style="text-align: center; font-family: \'Cambria Math\', serif; font-style: italic; margin: 1em 0; font-size: 12pt;">{content}</div>'
-    
-    text = re.sub(r'\$\$(.*?)\$\$', replace_display_math, text, flags=re.DOTALL)
-    
+
+    text = _DISPLAY_MATH_RE.sub(replace_display_math, text)
+
     # Replace $...$ with styled spans (inline math)
     def replace_inline_math(match):
         content = match.group(1)
         return f'<span style="font-family: \'Cambria Math\', serif; font-style: italic;">{content}</span>'
-    
-    text = re.sub(r'\$([^$]+)\$', replace_inline_math, text)
-    
+
+    text = _INLINE_MATH_RE.sub(replace_inline_math, text)
+
     return text
 
 def md_to_html(input_path: str, output_path: str = None, open_browser: bool = True):
@@ -196,11 +203,8 @@ def md_to_html(input_path: str, output_path: str = None, open_browser: bool = Tr
     # Process math before markdown conversion
     md_content = process_math(md_content)
     
-    # Convert to HTML with extensions
-    html_content = markdown.markdown(
-        md_content,
-        extensions=['fenced_code', 'tables', 'nl2br']
-    )
+    # Convert to HTML (shared converter, reset between documents)
+    html_content = _MD.reset().convert(md_content)
     
     # Wrap in full HTML document
     full_html = f"""<!DOCTYPE html>
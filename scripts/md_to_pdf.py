@@ -104,6 +104,20 @@ li {
 }
 """
 
+# One converter for the whole run — building a Markdown instance loads
+# extensions and compiles their regexes, so do it once, not per document.
+_MD = markdown.Markdown(extensions=['fenced_code', 'tables', 'nl2br'])
+
+# Compiled stylesheet, parsed lazily on first use and shared thereafter
+_CSS = None
+
+def _get_css():
+    """Parse STYLE through tinycss2 once; batch runs reuse the rule tree."""
+    global _CSS
+    if _CSS is None:
+        _CSS = CSS(string=STYLE)
+    return _CSS
+
 def md_to_pdf(input_path: str, output_path: str = None):
     """Convert markdown file to PDF."""
     input_file = Path(input_path)
@@ -116,11 +130,8 @@ def md_to_pdf(input_path: str, output_path: str = None):
     # Read markdown
     md_content = input_file.read_text(encoding='utf-8')
     
-    # Convert to HTML with extensions
-    html_content = markdown.markdown(
-        md_content,
-        extensions=['fenced_code', 'tables', 'nl2br']
-    )
+    # Convert to HTML (shared converter, reset between documents)
+    html_content = _MD.reset().convert(md_content)
     
     # Wrap in full HTML document
     full_html = f"""<!DOCTYPE html>
@@ -135,11 +146,14 @@ def md_to_pdf(input_path: str, output_path: str = None):
 </html>
 """
     
-    # Generate PDF
+    # Generate PDF — release the intermediate strings before rendering
+    # so peak memory is the DOM + PDF, not DOM + PDF + three full copies
+    # of the document text
     html_doc = HTML(string=full_html)
-    css = CSS(string=STYLE)
-    html_doc.write_pdf(output_path, stylesheets=[css])
-    
+    del md_content, html_content, full_html
+    with open(output_path, 'wb') as fp:
+        html_doc.write_pdf(target=fp, stylesheets=[_get_css()])
+
     print(f"✅ PDF generated: {output_path}")
     return output_path
 